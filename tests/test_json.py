@@ -1,4 +1,4 @@
-from typ.json import dumps, loads, dump, load, JsonError
+from typ.json import dumps, loads, dump, load, encode, JsonError
 from typing import Optional, List, Dict, Set, Tuple, Union, Any
 from dataclasses import dataclass
 from decimal import Decimal
@@ -9,6 +9,7 @@ from enum import Enum, IntEnum
 from typ.types.union import union
 from typ.types import char, NoneType
 from pytest import *
+import json
 from stringcase import snakecase
 
 
@@ -48,6 +49,80 @@ def test_decimal():
     check_success(Decimal, Decimal('1.23'), '1.23')
 
 
+def test_float_without_decimal_floats():
+    assert loads(List[float], '[1.23, 2]', decimal_floats=False) == [1.23, 2.0]
+
+
+def test_bytes_without_decimal_floats():
+    assert loads(List[float], b'[1.5]', decimal_floats=False) == [1.5]
+    assert loads(List[int], bytearray(b'[12345678901234567890]'), decimal_floats=False) == [12345678901234567890]
+    with open('temp', 'wb') as fp:
+        fp.write(b'[1.5, 2]')
+    with open('temp', 'rb') as fp:
+        assert load(fp, List[float], decimal_floats=False) == [1.5, 2.0]
+
+
+def test_big_int_without_decimal_floats():
+    assert loads(int, '123456789012345678901234567890', decimal_floats=False) == 123456789012345678901234567890
+
+
+def test_non_finite_without_decimal_floats():
+    assert loads(List[float], '[Infinity, 1e400]', decimal_floats=False) == [float('inf'), float('inf')]
+
+
+def test_decimal_without_decimal_floats():
+    with raises(JsonError):
+        loads(Decimal, '1.23', decimal_floats=False)
+
+
+def test_compact():
+    assert dumps({'a': [1, 2.5, 'ü']}, Dict[str, List[Any]], compact=True) == '{"a":[1,2.5,"ü"]}'
+
+
+def test_compact_big_int():
+    assert dumps([2 ** 70], compact=True) == f'[{2 ** 70}]'
+
+
+def test_compact_non_finite():
+    assert dumps([None, float('nan'), float('inf')], compact=True) == '[null,NaN,Infinity]'
+
+
+@dataclass
+class Measure:
+    name: str
+    tags: Optional[List[str]]
+    value: float
+
+
+def test_compact_floats():
+    assert dumps([1e16, 1e-7], List[float], compact=True) == '[1e+16,1e-07]'
+    assert dumps([float('nan'), float('-inf')], List[float], compact=True) == '[NaN,-Infinity]'
+    assert dumps(Measure('null\u00e9\n', None, 1e16), compact=True) == '{"name":"null\u00e9\\n","tags":null,"value":1e+16}'
+
+
+def test_compact_same_as_json_module():
+    values = [
+        (Measure('null\u00e9\n', ['\u0001'], 1e-7), Measure),
+        (TheClass('\u00e9\n', 2**70), TheClass),
+        (TheClass('\u00e9\n', 2), TheClass),
+        ({'a': [None, 'b']}, Dict[str, List[Optional[str]]]),
+        ((1, 'a'), Tuple[int, str]),
+    ]
+    for value, typ in values:
+        assert dumps(value, typ, compact=True) == json.dumps(encode(value, typ), separators=(',', ':'), ensure_ascii=False)
+
+
+def encode_date_native(encoder, typ, value):
+    if typ != date:
+        return Unsupported
+    return value
+
+
+def test_compact_custom_encoder_native_value():
+    with raises(TypeError):
+        dumps(date(year=2020, month=1, day=2), encoders=[encode_date_native], compact=True)
+
+
 def test_str():
     check_success(str, 'bla', '"bla"')
 
@@ -80,14 +155,52 @@ def test_datetime():
     check_success(datetime, datetime(year=2020, month=1, day=1, hour=17, minute=45, second=55, tzinfo=timezone.utc), '"2020-01-01T17:45:55+00:00"')
 
 
+def test_datetime_without_timezone():
+    with raises(JsonError):
+        loads(datetime, '"2020-01-01T17:45:55"')
+
+
+def test_datetime_week_format():
+    with raises(JsonError):
+        loads(datetime, '"2020-W01-1T12:34:56+05:30"')
+
+
 def test_time():
     check_success(time, time(hour=17, minute=45, second=55), '"17:45:55"')
 
 
+def test_time_wrong_format():
+    with raises(JsonError):
+        loads(time, '"174555.1"')
+    with raises(JsonError):
+        loads(time, '"17:45:5Z"')
+
+
 def test_date_wrong_type():
     check_json_error(date, 3, '3')
 
 
+def test_date_short_format():
+    assert loads(date, '"2020-1-2"') == date(year=2020, month=1, day=2)
+
+
+def test_date_datetime_value():
+    with raises(JsonError):
+        dumps(datetime(year=2020, month=1, day=2), date)
+
+
+def test_date_wrong_format():
+    with raises(JsonError, match='^Date should be represented'):
+        loads(date, '"01/02/2020"')
+
+
+def test_date_week_and_ordinal_format():
+    with raises(JsonError):
+        loads(date, '"2020-W01-1"')
+    with raises(JsonError):
+        loads(date, '"2020-002"')
+
+
 def test_uuid():
     check_success(UUID, UUID('bd65600d-8669-4903-8a14-af88203add38'), '"bd65600d-8669-4903-8a14-af88203add38"')
 
@@ -96,6 +209,18 @@ def test_generic_list():
     check_success(List[int], [2, 3], '[2, 3]')
 
 
+def test_generic_list_of_float():
+    check_success(List[float], [1.5, 2.0], '[1.5, 2.0]')
+    assert loads(List[float], '[1.5, 2]') == [1.5, 2.0]
+    assert loads(Dict[str, float], '{"a": 1.5}') == {'a': 1.5}
+    with raises(JsonError):
+        loads(List[float], '[1.5, true]')
+
+
+def test_generic_list_wrong_item_type():
+    check_json_error(List[int], [2, True], '[2, true]')
+
+
 def test_generic_list_of_date():
     check_success(List[date], [date(year=2020, month=1, day=2)], '["2020-01-02"]')
 
@@ -143,10 +268,45 @@ def test_dataclass():
     check_success(TheClass, TheClass('bla', 123), '{"string_field": "bla", "int_field": 123}')
 
 
+def test_union_dataclass():
+    check_success(Union[int, str, TheClass], TheClass('bla', 3), '{"string_field": "bla", "int_field": 3}')
+
+
 def test_dataclass_wrong_field_type():
     check_json_error(TheClass, TheClass('bla', 'wrong'), '{"string_field": "bla", "int_field": "wrong"}')
 
 
+@dataclass
+class SlotsClass:
+    __slots__ = ('string_field', 'int_field')
+    string_field: str
+    int_field: int
+
+
+def test_dataclass_slots():
+    check_success(SlotsClass, SlotsClass('bla', 123), '{"string_field": "bla", "int_field": 123}')
+
+
+@dataclass
+class InheritedClass(TheClass):
+    extra_field: str
+
+
+def test_dataclass_inherited():
+    check_success(TheClass, TheClass('bla', 123), '{"string_field": "bla", "int_field": 123}')
+    check_success(InheritedClass, InheritedClass('bla', 123, 'x'), '{"string_field": "bla", "int_field": 123, "extra_field": "x"}')
+
+
+@dataclass
+class ForwardRefClass:
+    value: 'int'
+    child: 'Optional[ForwardRefClass]'
+
+
+def test_dataclass_forward_ref():
+    check_success(ForwardRefClass, ForwardRefClass(1, ForwardRefClass(2, None)), '{"value": 1, "child": {"value": 2, "child": null}}')
+
+
 @dataclass
 class OneOptionalField:
     the_field: Optional[str]
@@ -160,6 +320,16 @@ def test_optional_field_present():
     assert loads(OneOptionalField, '{"the_field": null}', case=snakecase) == OneOptionalField(None)
 
 
+class Maybe(Enum):
+    NOTHING = None
+    SOMETHING = 's'
+
+
+def test_union_enum_null():
+    for _ in range(2):
+        assert loads(Optional[Maybe], 'null') == Maybe.NOTHING
+
+
 class Color(Enum):
     RED = 'r'
     BLUE = 'b'
@@ -243,7 +413,80 @@ def decode_int_custom(decoder, typ, json_value):
 
 def test_int_custom():
     assert dumps([3, 4, 5], encoders=[encode_int_custom]) == '["3", "4", "5"]'
+    assert dumps([3, 4, 5], List[int], encoders=[encode_int_custom]) == '["3", "4", "5"]'
     assert loads(List[int], '["3", "4", "5"]', decoders=[decode_int_custom]) == [3, 4, 5]
+    with raises(JsonError):
+        loads(List[int], '[3, 4, 5]', decoders=[decode_int_custom])
+    assert dumps([3, 4, 5], List[int]) == '[3, 4, 5]'
+    assert loads(List[int], '[3, 4, 5]') == [3, 4, 5]
+    assert loads(Union[date, int], '"3"', decoders=[decode_int_custom]) == 3
+
+
+def encode_big_int(encoder, typ, value):
+    if typ != int or abs(value) < 2**53:
+        return Unsupported
+    return str(value)
+
+
+def decode_big_int(decoder, typ, json_value):
+    if typ != int or type(json_value) is not str:
+        return Unsupported
+    return int(json_value)
+
+
+def test_custom_handler_for_some_values():
+    for _ in range(2):
+        assert dumps([1, 2**60], List[int], encoders=[encode_big_int]) == '[1, "1152921504606846976"]'
+        assert dumps({'a': 1, 'b': 2**60}, Dict[str, int], encoders=[encode_big_int]) == '{"a": 1, "b": "1152921504606846976"}'
+        assert dumps([1, 2**60], encoders=[encode_big_int]) == '[1, "1152921504606846976"]'
+        assert loads(List[int], '[1, "1152921504606846976"]', decoders=[decode_big_int]) == [1, 2**60]
+
+
+class Point:
+    def __init__(self, x):
+        self.x = x
+
+
+def test_custom_encoder_calls_per_item():
+    calls = []
+    def encode_point(encoder, typ, value):
+        if typ is not Point:
+            return Unsupported
+        calls.append(value.x)
+        return value.x
+    for _ in range(2):
+        assert dumps([Point(1), Point(2)], List[Point], encoders=[encode_point]) == '[1, 2]'
+        assert dumps({'a': Point(3)}, Dict[str, Point], encoders=[encode_point]) == '{"a": 3}'
+    assert calls == [1, 2, 3, 1, 2, 3]
+
+
+def decode_int_or_zero(decoder, typ, json_value):
+    if typ != int:
+        return Unsupported
+    if json_value is None:
+        return 0
+    check_type(int, json_value)
+    return json_value
+
+
+def test_union_custom_decoder_null():
+    for _ in range(2):
+        assert loads(Optional[int], 'null', decoders=[decode_int_or_zero]) == 0
+
+
+class Incomparable:
+    def __eq__(self, other):
+        raise TypeError('Incomparable can not be compared')
+
+
+def decode_incomparable(decoder, typ, json_value):
+    if typ != Incomparable:
+        return Unsupported
+    return Incomparable()
+
+
+def test_custom_decoder_result_not_compared():
+    assert isinstance(loads(Incomparable, '"x"', decoders=[decode_incomparable]), Incomparable)
 
 
 @union
@@ -260,6 +503,8 @@ def test_tagged_union():
     check_json_error(A, 3, '3')
     with raises(JsonError):
         loads(A, '{"garbage": 5, "number": 3}')
+    with raises(JsonError):
+        loads(A, '{"garbage": 5}')
 
 
 @dataclass
@@ -270,3 +515,45 @@ class StrangeCaseClass:
 
 def test_dataclass():
     check_success(StrangeCaseClass, StrangeCaseClass('bla', 123), '{"string_field": "bla", "int_field": 123}')
+
+
+def test_union_order():
+    check_success(Union[date, str], date(year=2020, month=1, day=2), '"2020-01-02"')
+    check_success(Union[str, date], '2020-01-02', '"2020-01-02"')
+    check_success(Tuple[Union[date, str], Union[str, date]], (date(year=2020, month=1, day=2), '2020-01-02'), '["2020-01-02", "2020-01-02"]')
+
+
+def test_unhashable_type():
+    with raises(JsonError, match='^Unsupported type'):
+        dumps([1], [int])
+    with raises(JsonError, match='^Unsupported type'):
+        loads([int], '[1]')
+
+
+def encode_broken(encoder, typ, value):
+    raise TypeError('broken encoder')
+
+
+def test_unhashable_type_handler_error():
+    with raises(JsonError, match='broken encoder'):
+        dumps([1], [int], encoders=[encode_broken])
+
+
+def test_repeated_calls_with_custom_handlers():
+    calls = []
+    def encode_point(encoder, typ, value):
+        if typ is not Point:
+            return Unsupported
+        calls.append(value.x)
+        return value.x
+    for x in range(3):
+        assert dumps(Point(x), encoders=[encode_point]) == str(x)
+        assert loads(List[int], f'["{x}"]', decoders=[decode_int_custom]) == [x]
+    assert calls == [0, 1, 2]
+
+
+def test_many_types():
+    enums = [Enum(f'Many{index}', {'A': index}) for index in range(5000)]
+    for enum in enums + enums[:10]:
+        assert dumps(enum.A) == str(enum.A.value)
+        assert loads(enum, str(enum.A.value)) is enum.A
@@ -79,6 +79,10 @@ def test_repr():
     assert repr(A.Unknown()) == "A.Unknown()"
 
 
+def test_member_attributes_in_slots():
+    assert vars(A.Text('something')) == {}
+
+
 def test_match_union():
     a = A.Text("something")
     result = match(a, {
@@ -111,6 +115,49 @@ def test_match_union_default():
     assert result == "not found"
 
 
+def test_match_union_other_union():
+    a = A.Text("something")
+    result = match(a, {
+        B.Text: lambda text: f'found: {text}',
+        default: lambda: 'not found',
+    })
+    assert result == "not found"
+
+
+def test_match_union_first_case():
+    a = A.Text("something")
+    result = match(a, {
+        A.Text: lambda text: f'member',
+        A.Text("something"): lambda text: f'value',
+    })
+    assert result == "member"
+    result = match(a, {
+        default: lambda: 'default',
+        A.Text: lambda text: f'member',
+    })
+    assert result == "default"
+
+
+def test_match_union_reused_cases():
+    cases = {
+        A.Text("something"): lambda text: 'value',
+        A.Text: lambda text: f'text: {text}',
+        A.Number: lambda number: f'number: {number}',
+        default: lambda: 'default',
+    }
+    for _ in range(2):
+        assert match(A.Text("something"), cases) == 'value'
+        assert match(A.Text("other"), cases) == 'text: other'
+        assert match(A.Number(1), cases) == 'number: 1'
+        assert match(A.Unknown(), cases) == 'default'
+    del cases[A.Number]
+    assert match(A.Number(1), cases) == 'default'
+    cases[B.Number] = lambda number: 'other union'
+    assert match(B.Number(1), cases) == 'default'
+    cases[default] = cases.pop(default)
+    assert match(B.Number(1), cases) == 'other union'
+
+
 def test_match_union_no_param():
     b = B.Unknown()
     result = b.match({
@@ -1,12 +1,14 @@
-from typing import Type, TypeVar, Callable, Optional, List, Union, Any
+from typing import Type, TypeVar, Callable, Optional, List, Tuple, Union, Any, get_type_hints
 from inspect import isclass
 import typing_inspect as inspect  # type: ignore
 import dataclasses
+import re
 from datetime import date, datetime, time
 from decimal import Decimal
 from uuid import UUID
 from typ.types import char, NoneType, union
 from enum import Enum
+from functools import lru_cache
 from stringcase import snakecase
 
 
@@ -27,135 +29,250 @@ class JsonError(Exception):
     pass
 
 
+def _generic_origin(typ):
+    return getattr(typ, '__origin__', None)
+
+
+def _type_args(typ):
+    return getattr(typ, '__args__', None) or ()
+
+
+def _is_union_type(typ):
+    if type(typ) is type:
+        return False
+    try:
+        return _is_union_form(typ)
+    except TypeError:  # unhashable typ
+        return False
+
+
+@lru_cache(maxsize=4096)
+def _is_union_form(typ):
+    return _generic_origin(typ) is Union or inspect.is_union_type(typ)
+
+
 def check_type(expected_type: Union[Type, List[Type]], value: Any):
     actual_type = type(value)
-    if type(expected_type) == list:
-        if not type(value) in expected_type:
-            raise JsonError(f'One of types {expected_type} expected, found type: {actual_type} value: {value}')
-    else:
-        if type(value) != expected_type:
-            raise JsonError(f'Type {expected_type} expected, found type: {actual_type} value: {value}')
+    if actual_type is expected_type:
+        return
+    if type(expected_type) is not list:
+        raise JsonError(f'Type {expected_type} expected, found type: {actual_type} value: {value}')
+    if actual_type not in expected_type:
+        raise JsonError(f'One of types {expected_type} expected, found type: {actual_type} value: {value}')
+
+
+_encode_primitive_types = frozenset([int, float, str, bool, NoneType])
+_decode_primitive_types = frozenset([int, Decimal, str, bool, NoneType])
+_decode_float_types = frozenset([int, float, Decimal])
+
+
+def _is_one_of(typ, types):
+    try:
+        return typ in types
+    except TypeError:  # unhashable typ
+        return False
 
 
 def encode_primitive(encoder, typ, value):
-    if typ not in [int, float, str, bool, NoneType]:
+    if not _is_one_of(typ, _encode_primitive_types):
         return Unsupported
-    check_type(typ, value)
+    if type(value) is not typ:
+        check_type(typ, value)
     return value
 
 
 def decode_primitive(decoder, typ, json_value):
-    if typ not in [int, Decimal, str, bool, NoneType]:
+    if not _is_one_of(typ, _decode_primitive_types):
         return Unsupported
-    check_type(typ, json_value)
+    if type(json_value) is not typ:
+        check_type(typ, json_value)
     return json_value
 
 
 def encode_char(encoder, typ, value):
-    if typ != char:
+    if typ is not char:
         return Unsupported
-    check_type(typ, value)
+    if type(value) is not typ:
+        check_type(typ, value)
     return str(value)
 
 
 def decode_char(decoder, typ, json_value):
-    if typ != char:
+    if typ is not char:
         return Unsupported
-    check_type(str, json_value)
+    if type(json_value) is not str:
+        check_type(str, json_value)
     if len(json_value) != 1:
         raise JsonError(f'char should be represented with str length 1, found: {json_value}')
     return json_value
 
 
 def decode_float(decoder, typ, json_value):
-    if typ != float:
+    if typ is not float:
         return Unsupported
-    check_type([int, float, Decimal], json_value)
+    if type(json_value) not in _decode_float_types:
+        check_type([int, float, Decimal], json_value)
     return float(json_value)
 
 
 def encode_decimal(encoder, typ, value):
-    if typ != Decimal:
+    if typ is not Decimal:
         return Unsupported
-    check_type(typ, value)
+    if type(value) is not typ:
+        check_type(typ, value)
     return float(value)
 
 
 def encode_date(encoder, typ, value):
-    if typ != date:
+    if typ is not date:
         return Unsupported
-    check_type(typ, value)
+    if type(value) is not typ:
+        check_type(typ, value)
     return value.isoformat()
 
 
+_iso_date = re.compile(r'\d{4}-\d{2}-\d{2}', re.ASCII)
+_iso_datetime = re.compile(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}[+-]\d{2}:\d{2}', re.ASCII)
+_iso_time = re.compile(r'\d{2}:\d{2}:\d{2}', re.ASCII)
+
+
 def decode_date(decoder, typ, json_value):
-    if typ != date:
+    if typ is not date:
         return Unsupported
-    check_type(str, json_value)
-    parsed_datetime = datetime.strptime(json_value, "%Y-%m-%d")
-    return parsed_datetime.date()
+    if type(json_value) is not str:
+        check_type(str, json_value)
+    try:
+        if _iso_date.fullmatch(json_value):
+            return date.fromisoformat(json_value)
+        return datetime.strptime(json_value, "%Y-%m-%d").date()
+    except ValueError:
+        raise JsonError(f'Date should be represented as str in format "%Y-%m-%d", found: {json_value}')
 
 
 def encode_datetime(encoder, typ, value):
-    if typ != datetime:
+    if typ is not datetime:
         return Unsupported
-    check_type(typ, value)
+    if type(value) is not typ:
+        check_type(typ, value)
     return value.isoformat()
 
 
 def decode_datetime(decoder, typ, json_value):
-    if typ != datetime:
+    if typ is not datetime:
         return Unsupported
-    check_type(str, json_value)
-    parsed = datetime.strptime(json_value, "%Y-%m-%dT%H:%M:%S%z")
-    return parsed
+    if type(json_value) is not str:
+        check_type(str, json_value)
+    try:
+        if _iso_datetime.fullmatch(json_value):
+            return datetime.fromisoformat(json_value)
+        return datetime.strptime(json_value, "%Y-%m-%dT%H:%M:%S%z")
+    except ValueError:
+        raise JsonError(f'Datetime should be represented as str in format "%Y-%m-%dT%H:%M:%S%z", found: {json_value}')
 
 
 def encode_time(encoder, typ, value):
-    if typ != time:
+    if typ is not time:
         return Unsupported
-    check_type(typ, value)
+    if type(value) is not typ:
+        check_type(typ, value)
     return value.isoformat()
 
 
 def decode_time(decoder, typ, json_value):
-    if typ != time:
+    if typ is not time:
         return Unsupported
-    check_type(str, json_value)
-    parsed_datetime = datetime.strptime(json_value, "%H:%M:%S")
-    return parsed_datetime.time()
+    if type(json_value) is not str:
+        check_type(str, json_value)
+    try:
+        if _iso_time.fullmatch(json_value):
+            return time.fromisoformat(json_value)
+        return datetime.strptime(json_value, "%H:%M:%S").time()
+    except ValueError:
+        raise JsonError(f'Time should be represented as str in format "%H:%M:%S", found: {json_value}')
 
 
 def encode_uuid(encoder, typ, value):
-    if typ != UUID:
+    if typ is not UUID:
         return Unsupported
-    check_type(typ, value)
+    if type(value) is not typ:
+        check_type(typ, value)
     return str(value)
 
 
 def decode_uuid(decoder, typ, json_value):
-    if typ != UUID:
+    if typ is not UUID:
         return Unsupported
-    check_type(str, json_value)
+    if type(json_value) is not str:
+        check_type(str, json_value)
     return UUID(json_value)
 
 
+__FIELD_INFO__ = '__typjson_field_info__'
+
+
+def _dataclass_fields(typ):
+    field_info = typ.__dict__.get(__FIELD_INFO__)
+    if field_info is None:
+        fields = dataclasses.fields(typ)
+        if any(isinstance(field.type, str) for field in fields):
+            hints = get_type_hints(typ)
+            field_info = tuple((field.name, hints[field.name] if isinstance(field.type, str) else field.type) for field in fields)
+        else:
+            field_info = tuple((field.name, field.type) for field in fields)
+        setattr(typ, __FIELD_INFO__, field_info)
+    return field_info
+
+
+@lru_cache(maxsize=4096)
+def _json_name(to_json_case, name):
+    if to_json_case is None:
+        return name
+    return to_json_case(name)
+
+
+@lru_cache(maxsize=4096)
+def _dataclass_encoder(typ, to_json_case):
+    # JSON keys are embedded as literals: compiled once per class, interned by the compiler, no per-instance key work
+    fields = _dataclass_fields(typ)
+    items = ', '.join(f'{repr(_json_name(to_json_case, name))}: encode(value.{name}, _t{index})' for index, (name, _) in enumerate(fields))
+    source = f'def encode(encoder, value):\n    encode = encoder.encode\n    return {{{items}}}\n'
+    namespace = {f'_t{index}': field_type for index, (_, field_type) in enumerate(fields)}
+    exec(source, namespace)
+    return namespace['encode']
+
+
+@lru_cache(maxsize=4096)
+def _dataclass_decoder(typ, to_json_case):
+    fields = _dataclass_fields(typ)
+    params = ', '.join(f'{name}=decode(_t{index}, get({repr(_json_name(to_json_case, name))}))' for index, (name, _) in enumerate(fields))
+    source = f'def decode(decoder, json_value):\n    decode = decoder.decode\n    get = json_value.get\n    return _typ({params})\n'
+    namespace = {f'_t{index}': field_type for index, (_, field_type) in enumerate(fields)}
+    namespace['_typ'] = typ
+    exec(source, namespace)
+    return namespace['decode']
+
+
+@lru_cache(maxsize=4096)
+def _is_dataclass_class(typ):
+    return dataclasses.is_dataclass(typ)
+
+
+def _is_dataclass_type(typ):
+    return isclass(typ) and _is_dataclass_class(typ)
+
+
 def encode_dataclass(encoder, typ, value):
-    if not dataclasses.is_dataclass(typ):
+    if not _is_dataclass_type(typ):
         return Unsupported
     check_type(typ, value)
-    fields = dataclasses.fields(typ)
-    return {encoder.to_json_case(field.name): encoder.encode(value.__dict__[field.name], field.type) for field in fields}
+    return _dataclass_encoder(typ, encoder._to_json_case)(encoder, value)
 
 
 def decode_dataclass(decoder, typ, json_value):
-    if not dataclasses.is_dataclass(typ):
+    if not _is_dataclass_type(typ):
         return Unsupported
     check_type(dict, json_value)
-    fields = dataclasses.fields(typ)
-    ctor_params = {field.name: decoder.decode(field.type, json_value.get(decoder.to_json_case(field.name))) for field in fields}
-    value = typ(**ctor_params)
-    return value
+    return _dataclass_decoder(typ, decoder._to_json_case)(decoder, json_value)
 
 
 def encode_enum(encoder, typ, value):
@@ -182,82 +299,196 @@ def decode_enum(decoder, typ, json_value):
     return enum_member
 
 
+def _encodes_as_is(encoder, item_type, items):
+    return encoder._builtin and item_type in _encode_primitive_types and set(map(type, items)) <= {item_type}
+
+
+def _encodes_all_as_is(encoder, items):
+    return encoder._builtin and set(map(type, items)) <= _encode_primitive_types
+
+
+def _decodes_as_is(decoder, item_type, json_items):
+    return decoder._builtin and item_type in _decode_primitive_types and set(map(type, json_items)) <= {item_type}
+
+
+def _decodes_floats(decoder, json_items):
+    return decoder._builtin and set(map(type, json_items)) <= _decode_float_types
+
+
+def _memoized_codec(coder, typ):
+    codec = coder._codecs.get(id(typ))
+    if codec is not None and codec[0] is typ:
+        return codec[1]
+    return None
+
+
+def _items_encoder(encoder, item_type):
+    codec = _memoized_codec(encoder, item_type)
+    if codec is not None:
+        return codec
+    return lambda encoder, item: encoder.encode(item, item_type)
+
+
+def _items_decoder(decoder, item_type):
+    codec = _memoized_codec(decoder, item_type)
+    if codec is not None:
+        return codec
+    return lambda decoder, json_item: decoder.decode(item_type, json_item)
+
+
 def encode_generic_list(encoder, typ, value):
-    if not (inspect.is_generic_type(typ) and inspect.get_origin(typ) == list):
+    if _generic_origin(typ) is not list:
         return Unsupported
     check_type(list, value)
-    item_type, = inspect.get_args(typ)
-    return [encoder.encode(item, item_type) for item in value]
+    item_type, = _type_args(typ)
+    if _encodes_as_is(encoder, item_type, value):
+        return list(value)
+    encode = _items_encoder(encoder, item_type)
+    return [encode(encoder, item) for item in value]
 
 
 def decode_generic_list(decoder, typ, json_value):
-    if not (inspect.is_generic_type(typ) and inspect.get_origin(typ) == list):
+    if _generic_origin(typ) is not list:
         return Unsupported
     check_type(list, json_value)
-    item_type = inspect.get_args(typ)[0]
-    return [decoder.decode(item_type, item) for item in json_value]
+    item_type = _type_args(typ)[0]
+    if _decodes_as_is(decoder, item_type, json_value):
+        return list(json_value)
+    if item_type is float and _decodes_floats(decoder, json_value):
+        return list(map(float, json_value))
+    decode = _items_decoder(decoder, item_type)
+    return [decode(decoder, item) for item in json_value]
 
 
 def encode_generic_dict(encoder, typ, value):
-    if not (inspect.is_generic_type(typ) and inspect.get_origin(typ) == dict):
+    if _generic_origin(typ) is not dict:
         return Unsupported
     check_type(dict, value)
-    key_type, value_type = inspect.get_args(typ)
-    if key_type != str:
+    key_type, value_type = _type_args(typ)
+    if key_type is not str:
         raise JsonError(f'Dict key type {key_type} is not supported for JSON serialization, key should be of type str')
-    return {key: encoder.encode(value, value_type) for (key, value) in value.items()}
+    if _encodes_as_is(encoder, value_type, value.values()):
+        return dict(value)
+    encode = _items_encoder(encoder, value_type)
+    return {key: encode(encoder, value) for (key, value) in value.items()}
 
 
 def decode_generic_dict(decoder, typ, json_value):
-    if not (inspect.is_generic_type(typ) and inspect.get_origin(typ) == dict):
+    if _generic_origin(typ) is not dict:
         return Unsupported
     check_type(dict, json_value)
-    key_type, value_type = inspect.get_args(typ)
-    if key_type != str:
+    key_type, value_type = _type_args(typ)
+    if key_type is not str:
         raise JsonError(f'Dict key type {key_type} is not supported for JSON deserialization - key should be str')
-    return {key: decoder.decode(value_type, value) for (key, value) in json_value.items()}
+    if _decodes_as_is(decoder, value_type, json_value.values()):
+        return dict(json_value)
+    if value_type is float and _decodes_floats(decoder, json_value.values()):
+        return dict(zip(json_value.keys(), map(float, json_value.values())))
+    decode = _items_decoder(decoder, value_type)
+    return {key: decode(decoder, value) for (key, value) in json_value.items()}
 
 
 def encode_generic_tuple(encoder, typ, value):
-    if not inspect.is_tuple_type(typ):
+    if _generic_origin(typ) is not tuple:
         return Unsupported
     check_type(tuple, value)
-    items_types = inspect.get_args(typ)
+    items_types = _type_args(typ)
     if len(items_types) != len(value):
         raise JsonError(f'Expected tuple of size: {len(items_types)}, found tuple of size: {len(value)}, value: {value}')
-    return tuple(map(lambda item, item_type: encoder.encode(item, item_type), value, items_types))
+    encode = encoder.encode
+    return tuple([encode(item, item_type) for item, item_type in zip(value, items_types)])
 
 
 def decode_generic_tuple(decoder, typ, json_value):
-    if not inspect.is_tuple_type(typ):
+    if _generic_origin(typ) is not tuple:
         return Unsupported
     check_type(list, json_value)
-    items_types = inspect.get_args(typ)
+    items_types = _type_args(typ)
     if len(items_types) != len(json_value):
         raise JsonError(f'Expected list of size: {len(items_types)}, found tuple of size: {len(json_value)}, value: {json_value}')
-    return tuple(map(lambda item, item_type: decoder.decode(item_type, item), json_value, items_types))
+    decode = decoder.decode
+    return tuple([decode(item_type, item) for item, item_type in zip(json_value, items_types)])
 
 
 def encode_generic_set(encoder, typ, value):
-    if not (inspect.is_generic_type(typ) and inspect.get_origin(typ) == set):
+    if _generic_origin(typ) is not set:
         return Unsupported
     check_type(set, value)
-    item_type, = inspect.get_args(typ)
-    return [encoder.encode(item, item_type) for item in value]
+    item_type, = _type_args(typ)
+    if _encodes_as_is(encoder, item_type, value):
+        return list(value)
+    encode = _items_encoder(encoder, item_type)
+    return [encode(encoder, item) for item in value]
 
 
 def decode_generic_set(decoder, typ, json_value):
-    if not (inspect.is_generic_type(typ) and inspect.get_origin(typ) == set):
+    if _generic_origin(typ) is not set:
         return Unsupported
     check_type(list, json_value)
-    item_type = inspect.get_args(typ)[0]
-    return set([decoder.decode(item_type, item) for item in json_value])
+    item_type = _type_args(typ)[0]
+    if _decodes_as_is(decoder, item_type, json_value):
+        return set(json_value)
+    if item_type is float and _decodes_floats(decoder, json_value):
+        return set(map(float, json_value))
+    decode = _items_decoder(decoder, item_type)
+    return {decode(decoder, item) for item in json_value}
 
 
-def encode_union(encoder, typ, value):
-    if not inspect.is_union_type(typ):
-        return Unsupported
-    union_types = inspect.get_args(typ)
+def _union_classes(union_types):
+    return frozenset(union_type for union_type in union_types if isclass(union_type))
+
+
+_str_decoded_types = frozenset([char, date, datetime, time, UUID])
+
+
+def _json_types(typ):
+    if typ in _decode_primitive_types:
+        return frozenset([typ])
+    if typ is float:
+        return _decode_float_types
+    if typ in _str_decoded_types:
+        return frozenset([str])
+    origin = _generic_origin(typ)
+    if origin in (list, set, tuple):
+        return frozenset([list])
+    if origin is dict or _is_dataclass_type(typ):
+        return frozenset([dict])
+    return None
+
+
+def _union_types_for(union_types, json_type):
+    return tuple(union_type for union_type in union_types if json_type in (_json_types(union_type) or (json_type,)))
+
+
+_floatless_types = frozenset([int, str, bool, NoneType, char, date, datetime, time, UUID])
+
+
+def _encodes_floats(typ, seen):
+    if typ in _floatless_types or typ in seen:
+        return False
+    if union.isunion(typ):
+        member_types = [member_type for member_type in union.members(typ).values() if member_type is not None]
+    elif isclass(typ) and issubclass(typ, Enum):
+        member_types = [type(member.value) for member in typ]
+    elif _is_dataclass_type(typ):
+        member_types = [field_type for _, field_type in _dataclass_fields(typ)]
+    elif _generic_origin(typ) in (list, dict, tuple, set) or _is_union_type(typ):
+        member_types = _type_args(typ)
+    else:
+        return True
+    seen = seen | {typ}
+    return any(_encodes_floats(member_type, seen) for member_type in member_types)
+
+
+@lru_cache(maxsize=4096)
+def _may_encode_float(typ):
+    return _encodes_floats(typ, frozenset())
+
+
+def _encode_union_value(encoder, typ, union_types, union_classes, value):
+    value_type = type(value)
+    if value_type in union_classes:
+        return encoder.encode(value, value_type)
     for union_type in union_types:
         try:
             return encoder.encode(value, union_type)
@@ -266,10 +497,7 @@ def encode_union(encoder, typ, value):
     raise JsonError(f'Value {value} can not be deserialized as {typ}')
 
 
-def decode_union(decoder, typ, json_value):
-    if not inspect.is_union_type(typ):
-        return Unsupported
-    union_types = inspect.get_args(typ)
+def _decode_union_value(decoder, typ, union_types, json_value):
     for union_type in union_types:
         try:
             return decoder.decode(union_type, json_value)
@@ -278,128 +506,346 @@ def decode_union(decoder, typ, json_value):
     raise JsonError(f'Value {json_value} can not be deserialized as {typ}')
 
 
+def encode_union(encoder, typ, value):
+    if not _is_union_type(typ):
+        return Unsupported
+    union_types = _type_args(typ)
+    return _encode_union_value(encoder, typ, union_types, _union_classes(union_types), value)
+
+
+def decode_union(decoder, typ, json_value):
+    if not _is_union_type(typ):
+        return Unsupported
+    return _decode_union_value(decoder, typ, _type_args(typ), json_value)
+
+
+@lru_cache(maxsize=4096)
+def _tagged_union_json_names(typ, to_json_case):
+    return {name: _json_name(to_json_case, name) for name in union.members(typ)}
+
+
 def encode_tagged_union(encoder, typ, value):
     if not union.isunion(typ):
         return Unsupported
-    json_value_key = encoder.to_json_case(union.member_name(value))
+    member_name = union.member_name(value)
+    json_value_key = _tagged_union_json_names(typ, encoder._to_json_case).get(member_name)
+    if json_value_key is None:
+        json_value_key = encoder.to_json_case(member_name)
     json_value_val = encoder.encode(value.value, union.member_type(value))
     return {json_value_key: json_value_val}
 
 
+@lru_cache(maxsize=4096)
+def _tagged_union_members(typ, to_json_case):
+    return {_json_name(to_json_case, name): (getattr(typ, name), member_type) for name, member_type in union.members(typ).items()}
+
+
 def decode_tagged_union(decoder, typ, json_value):
     if not union.isunion(typ):
         return Unsupported
     check_type(dict, json_value)
     if len(json_value) != 1:
         raise JsonError(f'Value {json_value} can not be deserialized as {typ} tagged_union should be represented as object with single field')
-    json_value_key = list(json_value.keys())[0]
-    json_value_val = json_value[json_value_key]
-    member = next((m for m in union.members(typ) if decoder.to_json_case(m) == json_value_key), None)
-    member_type = union.members(typ)[member]
+    json_value_key, json_value_val = next(iter(json_value.items()))
+    member = _tagged_union_members(typ, decoder._to_json_case).get(json_value_key)
+    if member is None:
+        raise JsonError(f'Value {json_value} can not be deserialized as {typ} - unknown member {json_value_key}')
+    create_member, member_type = member
     if member_type is None:
-        return union.create_member(typ, member, None)
+        return create_member()
     else:
-        return union.create_member(typ, member, decoder.decode(member_type, json_value_val))
+        return create_member(decoder.decode(member_type, json_value_val))
 
 
 def encode_any(encoder, typ, value):
-    if typ != Any:
+    if typ is not Any:
         return Unsupported
     return encoder.encode(value, typ=type(value))
 
 
 def decode_any(decoder, typ, json_value):
-    if typ != Any:
+    if typ is not Any:
         return Unsupported
     return decoder.decode(type(json_value), json_value)
 
 
 def encode_list(encoder, typ, value):
-    if typ != list:
+    if typ is not list:
         return Unsupported
     check_type(list, value)
-    return [encoder.encode(item, typ=None) for item in value]
+    if _encodes_all_as_is(encoder, value):
+        return list(value)
+    encode = encoder.encode
+    return [encode(item, typ=None) for item in value]
 
 
 def encode_dict(encoder, typ, value):
-    if typ != dict:
+    if typ is not dict:
         return Unsupported
     check_type(dict, value)
-    return {item_key: encoder.encode(item_value, typ=None) for item_key, item_value in value.items()}
+    if _encodes_all_as_is(encoder, value.values()):
+        return dict(value)
+    encode = encoder.encode
+    return {item_key: encode(item_value, typ=None) for item_key, item_value in value.items()}
 
 
 def encode_tuple(encoder, typ, value):
-    if typ != tuple:
+    if typ is not tuple:
         return Unsupported
     check_type(tuple, value)
-    return [encoder.encode(item, typ=None) for item in value]
+    if _encodes_all_as_is(encoder, value):
+        return list(value)
+    encode = encoder.encode
+    return [encode(item, typ=None) for item in value]
 
 
 def encode_set(encoder, typ, value):
-    if typ != set:
+    if typ is not set:
         return Unsupported
     check_type(set, value)
-    return [encoder.encode(item, typ=None) for item in value]
+    if _encodes_all_as_is(encoder, value):
+        return list(value)
+    encode = encoder.encode
+    return [encode(item, typ=None) for item in value]
+
+
+def _specialize_encode_primitive(encoder, typ):
+    def encode(encoder, value):
+        if type(value) is not typ:
+            check_type(typ, value)
+        return value
+    return encode
+
+
+def _specialize_decode_primitive(decoder, typ):
+    def decode(decoder, json_value):
+        if type(json_value) is not typ:
+            check_type(typ, json_value)
+        return json_value
+    return decode
+
+
+def _specialize_encode_leaf(convert):
+    def specialize(encoder, typ):
+        def encode(encoder, value):
+            if type(value) is not typ:
+                check_type(typ, value)
+            return convert(value)
+        return encode
+    return specialize
+
+
+def _specialize_encode_dataclass(encoder, typ):
+    encode_fields = _dataclass_encoder(typ, encoder._to_json_case)
+    def encode(encoder, value):
+        if type(value) is not typ:
+            check_type(typ, value)
+        return encode_fields(encoder, value)
+    return encode
+
+
+def _specialize_decode_dataclass(decoder, typ):
+    decode_fields = _dataclass_decoder(typ, decoder._to_json_case)
+    def decode(decoder, json_value):
+        if type(json_value) is not dict:
+            check_type(dict, json_value)
+        return decode_fields(decoder, json_value)
+    return decode
+
+
+def _specialize_encode_union(encoder, typ):
+    union_types = _type_args(typ)
+    union_classes = _union_classes(union_types)
+    def encode(encoder, value):
+        return _encode_union_value(encoder, typ, union_types, union_classes, value)
+    return encode
+
+
+def _specialize_decode_union(decoder, typ):
+    union_types = _type_args(typ)
+    union_types_by_json_type = {}
+    def decode(decoder, json_value):
+        json_type = type(json_value)
+        candidate_types = union_types_by_json_type.get(json_type)
+        if candidate_types is None:
+            candidate_types = union_types_by_json_type[json_type] = _union_types_for(union_types, json_type)
+        return _decode_union_value(decoder, typ, candidate_types, json_value)
+    return decode
+
+
+_encode_specializers = {
+    encode_primitive: _specialize_encode_primitive,
+    encode_char: _specialize_encode_leaf(str),
+    encode_decimal: _specialize_encode_leaf(float),
+    encode_date: _specialize_encode_leaf(date.isoformat),
+    encode_datetime: _specialize_encode_leaf(datetime.isoformat),
+    encode_time: _specialize_encode_leaf(time.isoformat),
+    encode_uuid: _specialize_encode_leaf(str),
+    encode_dataclass: _specialize_encode_dataclass,
+    encode_union: _specialize_encode_union,
+}
+
+_decode_specializers = {
+    decode_primitive: _specialize_decode_primitive,
+    decode_dataclass: _specialize_decode_dataclass,
+    decode_union: _specialize_decode_union,
+}
+
+
+def _codec(specializers, handler, coder, typ):
+    specialize = specializers.get(handler)
+    if specialize is not None:
+        return specialize(coder, typ)
+    return lambda coder, value: handler(coder, typ, value)
+
+
+def _seed(specializers, handlers_by_type):
+    return {id(typ): (typ, _codec(specializers, handler, None, typ)) for typ, handler in handlers_by_type.items()}
+
+
+_encode_seed_codecs = _seed(_encode_specializers, {
+    int: encode_primitive,
+    float: encode_primitive,
+    str: encode_primitive,
+    bool: encode_primitive,
+    NoneType: encode_primitive,
+    char: encode_char,
+    Decimal: encode_decimal,
+    date: encode_date,
+    datetime: encode_datetime,
+    time: encode_time,
+    UUID: encode_uuid,
+    list: encode_list,
+    dict: encode_dict,
+    tuple: encode_tuple,
+    set: encode_set,
+})
+
+_decode_seed_codecs = _seed(_decode_specializers, {
+    int: decode_primitive,
+    Decimal: decode_primitive,
+    str: decode_primitive,
+    bool: decode_primitive,
+    NoneType: decode_primitive,
+    char: decode_char,
+    float: decode_float,
+    date: decode_date,
+    datetime: decode_datetime,
+    time: decode_time,
+    UUID: decode_uuid,
+})
 
 
 T = TypeVar('T')
 
 
+# Memoized types are dropped once this many are cached, so generated types do not grow the tables forever
+_codecs_limit = 4096
+
+
+def _is_hashable(typ):
+    try:
+        hash(typ)
+    except TypeError:
+        return False
+    return True
+
+
 class Decoder:
+    __slots__ = ('decoders', '_to_json_case', '_builtin', '_codecs')
+
     def __init__(self, decoders, to_json_case):
-        self.decoders = decoders
+        self.decoders = tuple(decoders)
         self._to_json_case = to_json_case
+        # Built-in handlers decide from typ alone, custom ones may depend on the value, so only built-in choices are memoized
+        self._builtin = self.decoders == json_decoders
+        self._reset()
+
+    def _reset(self):
+        self._codecs = dict(_decode_seed_codecs) if self._builtin else {}
 
     def to_json_case(self, name):
-        if self._to_json_case is None:
-            return name
-        return self._to_json_case(name)
+        return _json_name(self._to_json_case, name)
 
     def decode(self, typ: Type[T], json_value: Any) -> T:
+        codec = self._codecs.get(id(typ))
+        if codec is not None and codec[0] is typ:
+            result = codec[1](self, json_value)
+            if result is not Unsupported:
+                return result
         for decoder in self.decoders:
             result = decoder(self, typ, json_value)
-            if result != Unsupported:
+            if result is not Unsupported:
+                if self._builtin and _is_hashable(typ):
+                    if len(self._codecs) >= _codecs_limit:
+                        self._reset()
+                    self._codecs[id(typ)] = (typ, _codec(_decode_specializers, decoder, self, typ))
                 return result
         raise JsonError(f'Unsupported type {typ}')
 
 
 class Encoder:
+    __slots__ = ('encoders', '_to_json_case', '_builtin', '_codecs')
+
     def __init__(self, encoders, to_json_case):
-        self.encoders = encoders
+        self.encoders = tuple(encoders)
         self._to_json_case = to_json_case
+        # Built-in handlers decide from typ alone, custom ones may depend on the value, so only built-in choices are memoized
+        self._builtin = self.encoders == json_encoders
+        self._reset()
+
+    def _reset(self):
+        self._codecs = dict(_encode_seed_codecs) if self._builtin else {}
 
     def to_json_case(self, name):
-        if self._to_json_case is None:
-            return name
-        return self._to_json_case(name)
+        return _json_name(self._to_json_case, name)
 
     def encode(self, value: T, typ: Optional[Type[T]] = None):
         typ = typ if typ is not None else type(value)
+        codec = self._codecs.get(id(typ))
+        if codec is not None and codec[0] is typ:
+            result = codec[1](self, value)
+            if result is not Unsupported:
+                return result
         for encoder in self.encoders:
             result = encoder(self, typ, value)
-            if result != Unsupported:
+            if result is not Unsupported:
+                if self._builtin and _is_hashable(typ):
+                    if len(self._codecs) >= _codecs_limit:
+                        self._reset()
+                    self._codecs[id(typ)] = (typ, _codec(_encode_specializers, encoder, self, typ))
                 return result
         raise JsonError(f'Unsupported type {typ}')
 
 
+@lru_cache(maxsize=64)
+def _shared_decoder(decoders, to_json_case):
+    return Decoder(decoders, to_json_case)
+
+
+@lru_cache(maxsize=64)
+def _shared_encoder(encoders, to_json_case):
+    return Encoder(encoders, to_json_case)
+
+
 def decode(typ: Type[T], json_value: Any, case: CaseConverter = None, decoders: List[DecodeFunc] = []):
     try:
-        return Decoder(decoders, case).decode(typ, json_value)
+        return _shared_decoder(tuple(decoders), case).decode(typ, json_value)
     except Exception as error:
-        if error is JsonError:
-            raise error
+        if isinstance(error, JsonError):
+            raise
         raise JsonError(f'Error during decoding: {error}')
 
 
 def encode(value: T, typ: Optional[Type[T]] = None, case: CaseConverter = None, encoders: List[EncodeFunc] = []):
     try:
-        return Encoder(encoders, case).encode(value, typ)
+        return _shared_encoder(tuple(encoders), case).encode(value, typ)
     except Exception as error:
-        if error is JsonError:
-            raise error
+        if isinstance(error, JsonError):
+            raise
         raise JsonError(f'Error during encoding: {error}')
 
-json_encoders: List[EncodeFunc] = [
+json_encoders: Tuple[EncodeFunc, ...] = (
     encode_primitive,
     encode_char,
     encode_decimal,
@@ -420,9 +866,9 @@ json_encoders: List[EncodeFunc] = [
     encode_dict,
     encode_tuple,
     encode_set,
-]
+)
 
-json_decoders: List[DecodeFunc] = [
+json_decoders: Tuple[DecodeFunc, ...] = (
     decode_primitive,
     decode_char,
     decode_float,
@@ -439,4 +885,4 @@ json_decoders: List[DecodeFunc] = [
     decode_enum,
     decode_tagged_union,
     decode_any,
-]
+)
@@ -3,6 +3,12 @@ from typ import encoding
 from typ.encoding import CaseConverter, DecodeFunc, EncodeFunc, json_encoders, json_decoders, JsonError
 import decimal
 import json
+import re
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
 
 
 T = TypeVar('T')
@@ -14,7 +20,7 @@ def decode(
         case: CaseConverter = None,
         decoders: List[DecodeFunc] = [],
         ) -> T:
-    return encoding.decode(typ, data, case=case, decoders=decoders + json_decoders)
+    return encoding.decode(typ, data, case=case, decoders=(*decoders, *json_decoders) if decoders else json_decoders)
 
 
 def encode(
@@ -23,7 +29,39 @@ def encode(
         case: CaseConverter = None,
         encoders: List[EncodeFunc] = [],
         ) -> Any:
-    return encoding.encode(value, typ, case=case, encoders=encoders+json_encoders)
+    return encoding.encode(value, typ, case=case, encoders=(*encoders, *json_encoders) if encoders else json_encoders)
+
+
+_long_number = re.compile(r'\d{19}')
+_long_number_bytes = re.compile(rb'\d{19}')
+
+
+def _parse(json_str: str, decimal_floats: bool) -> Any:
+    if decimal_floats:
+        return json.loads(json_str, parse_float=decimal.Decimal)
+    long_number = _long_number_bytes if isinstance(json_str, (bytes, bytearray)) else _long_number
+    if orjson is not None and not long_number.search(json_str):
+        try:
+            return orjson.loads(json_str)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(json_str)
+
+
+def _orjson_serializable(typ: Type, encoders: List[EncodeFunc]) -> bool:
+    # Custom encoders may return values only orjson accepts, and orjson formats floats differently from json module
+    return orjson is not None and not encoders and not encoding._may_encode_float(typ)
+
+
+def _serialize(json_value: Any, typ: Type, encoders: List[EncodeFunc], indent: Optional[int], compact: bool) -> str:
+    if compact and indent is None:
+        if _orjson_serializable(typ, encoders):
+            try:
+                return orjson.dumps(json_value, option=orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_SUBCLASS).decode()
+            except orjson.JSONEncodeError:
+                pass
+        return json.dumps(json_value, separators=(',', ':'), ensure_ascii=False)
+    return json.dumps(json_value, indent=indent)
 
 
 def loads(
@@ -31,8 +69,9 @@ def loads(
         json_str: str,
         case: CaseConverter = None,
         decoders: List[DecodeFunc] = [],
+        decimal_floats: bool = True,
         ) -> T:
-    json_value = json.loads(json_str, parse_float=decimal.Decimal)
+    json_value = _parse(json_str, decimal_floats)
     return decode(typ, json_value, case=case, decoders=decoders)
 
 
@@ -42,9 +81,10 @@ def dumps(
         case: CaseConverter = None,
         encoders: List[EncodeFunc] = [],
         indent: Optional[int] = None,
+        compact: bool = False,
         ) -> str:
     json_value = encode(value, typ, case=case, encoders=encoders)
-    return json.dumps(json_value, indent=indent)
+    return _serialize(json_value, typ if typ is not None else type(value), encoders, indent, compact)
 
 
 def load(
@@ -52,8 +92,9 @@ def load(
         typ: Type[T],
         case: CaseConverter = None,
         decoders: List[DecodeFunc] = [],
+        decimal_floats: bool = True,
         ) -> T:
-    json_value = json.load(fp, parse_float=decimal.Decimal)
+    json_value = _parse(fp.read(), decimal_floats)
     return decode(typ, json_value, case=case, decoders=decoders)
 
 
@@ -64,6 +105,6 @@ def dump(
         case: CaseConverter = None,
         encoders: List[EncodeFunc] = [],
         indent: Optional[int] = None,
+        compact: bool = False,
         ) -> None:
-    json_value = encode(value, typ, case=case, encoders=encoders)
-    return json.dump(json_value, fp, indent=indent)
+    fp.write(dumps(value, typ, case=case, encoders=encoders, indent=indent, compact=compact))
@@ -1,8 +1,11 @@
 __UNION_MEMBERS__ = "__union_members"
+__UNION_CREATORS__ = "__union_creators"
 
 
 def union(union_class):
     class UnionMember(union_class):
+        __slots__ = ('_member_name', '_member_type', 'value', '_args')
+
         def __init__(self, member_name, member_type, value):
             self._member_name = member_name
             self._member_type = member_type
@@ -34,6 +37,8 @@ def union(union_class):
             return match(self, cases)
 
     class UnionMemberCreator:
+        __slots__ = ('_union_type', '_member_name', '_member_type')
+
         def __init__(self, union_type, member_name, member_type):
             self._union_type = union_type
             self._member_name = member_name
@@ -64,10 +69,13 @@ def union(union_class):
 
     union_members = union_class.__dict__.get('__annotations__', {})
 
-    for name, typ in union_members.items():
-        setattr(union_class, name, UnionMemberCreator(union_class, name, typ))
+    union_creators = {name: UnionMemberCreator(union_class, name, typ) for name, typ in union_members.items()}
+
+    for name, creator in union_creators.items():
+        setattr(union_class, name, creator)
 
     setattr(union_class, __UNION_MEMBERS__, union_members)
+    setattr(union_class, __UNION_CREATORS__, union_creators)
 
     return union_class
 
@@ -127,11 +135,44 @@ def _match_case(case_key, obj):
         return case_key == obj
 
 
+# Key positions are built once per cases dict and reused while its keys stay the same objects in the same order
+_case_positions_limit = 256
+_case_positions = {}
+
+
+def _positions(cases):
+    case_keys = tuple(cases)
+    entry = _case_positions.get(id(cases))
+    if entry is not None and entry[0] is cases and entry[1] == case_keys:
+        return entry[2]
+    if len(_case_positions) >= _case_positions_limit:
+        _case_positions.clear()
+    positions = {case_key: index for index, case_key in enumerate(case_keys)}
+    _case_positions[id(cases)] = (cases, case_keys, positions)
+    return positions
+
+
+def _find_case(obj, cases):
+    try:
+        hash(obj)
+    except TypeError:
+        return next(((case_key, case_lambda) for case_key, case_lambda in cases.items() if _match_case(case_key, obj)), (None, None))
+    positions = _positions(cases)
+    keys = [obj, default]
+    if _isinstance_member(obj):
+        keys.append(getattr(type(obj), __UNION_CREATORS__).get(obj._member_name))
+    found = [key for key in keys if key in positions]
+    if not found:
+        return None, None
+    case_key = min(found, key=positions.get)
+    return case_key, cases[case_key]
+
+
 def match(obj, cases):
-    case_key, case_lambda = next(((case_key, case_lambda) for case_key, case_lambda in cases.items() if _match_case(case_key, obj)), (None, None))
+    case_key, case_lambda = _find_case(obj, cases)
     if case_lambda is None:
         raise ValueError(f'{obj} was not matched by any case')
-    if case_key == default:
+    if case_key is default:
         return case_lambda()
     else:
         return case_lambda(obj.value)